@@ -0,0 +1,75 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+# Run from anywhere: point child interpreters at the src layout
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# Modules that should stay unloaded until a geometry-producing call. Lazy
+# placeholders sit in sys.modules under the top-level name, so check submodules.
+HEAVY_MODULES = ['geopandas.geodataframe', 'shapely', 'pyogrio', 'pandas.core', 'requests.sessions']
+
+# (label, code to time, should the heavy modules stay unloaded)
+SCENARIOS = [
+    ("import census", "import census", True),
+    ("get_fips", "from census import get_fips; get_fips('MA')", True),
+    ("import jt_cli", "import census.jt_cli", True),
+    ("import geopandas (reference)", "import geopandas", False),
+]
+
+# Child script: time the snippet in a fresh interpreter and report what it loaded
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{'ms': elapsed * 1000, 'heavy': heavy}}))
+"""
+
+
+def time_scenario(code, repeat):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    timings, heavy = [], []
+
+    for _ in range(repeat):
+        child = CHILD.format(code=code, heavy=HEAVY_MODULES)
+        # -B so a stale .pyc write doesn't skew one run against another
+        out = subprocess.run([sys.executable, '-B', '-c', child], env=env, capture_output=True, text=True, check=True)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        timings.append(result['ms'])
+        heavy = result['heavy']
+
+    return timings, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start import latency for the census package.")
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="fresh interpreters per scenario (default: 10)")
+    parser.add_argument("--max-ms", type=float, help="fail if the median cold 'import census' exceeds this")
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'scenario':<32}{'min ms':>10}{'median ms':>12}  heavy modules loaded")
+
+    for label, code, light in SCENARIOS:
+        timings, heavy = time_scenario(code, args.repeat)
+        median = statistics.median(timings)
+        print(f"{label:<32}{min(timings):>10.1f}{median:>12.1f}  {', '.join(heavy) or '-'}")
+
+        if light and heavy:
+            print(f"  FAIL: {label} loaded {', '.join(heavy)}")
+            failed = True
+        if label == "import census" and args.max_ms is not None and median > args.max_ms:
+            print(f"  FAIL: median {median:.1f} ms exceeds --max-ms {args.max_ms:.1f}")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
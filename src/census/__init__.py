@@ -0,0 +1,2 @@
+from .jt_census import get_acs, get_dec, get_fips, get_tig, vars_acs, vars_dec
+from .jt_lehd import fetch_LODES_series, fetch_OD, fetch_WAC, get_blocks, get_muni, lodes_catalog
@@ -0,0 +1,194 @@
+import functools
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from .jt_lazy import lazy_import
+
+requests = lazy_import('requests')
+
+
+# Published decennial and ACS vintages never change, so responses are cached
+# indefinitely. Set JT_CENSUS_CACHE to move the on-disk tier.
+CACHE_DIR = os.environ.get('JT_CENSUS_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'jt_census'))
+MEMORY_SIZE = 32
+
+# Byte budget for the in-memory tier of API responses. A block group pull for a
+# big county parses to tens of MB of Python strings; the disk tier keeps the rest.
+# Set JT_CENSUS_RESPONSE_CACHE_MB to raise or lower it.
+RESPONSE_CACHE_BYTES = int(os.environ.get('JT_CENSUS_RESPONSE_CACHE_MB', '256')) * 1024 ** 2
+
+# Byte budget for each memoized store of frames (TIGER shapes, LODES files).
+# Set JT_CENSUS_FRAME_CACHE_MB to raise or lower it.
+FRAME_CACHE_BYTES = int(os.environ.get('JT_CENSUS_FRAME_CACHE_MB', '1024')) * 1024 ** 2
+
+
+def new_store(size, maxbytes=None):
+    # An in-process LRU tier plus the loads currently in flight for it
+    return {'items': OrderedDict(), 'sizes': {}, 'bytes': 0, 'inflight': {}, 'lock': threading.Lock(), 'size': size, 'maxbytes': maxbytes}
+
+
+def nbytes(data):
+    # Approximate in-memory size of a cached frame or parsed API response; 0 for anything else
+    if isinstance(data, list):
+        # census API responses are a header row plus rows of short strings, so
+        # size one row and scale it rather than walking every cell
+        if not data or not isinstance(data[-1], list):
+            return sys.getsizeof(data)
+        row = data[-1]
+        row_size = sys.getsizeof(row) + sum(sys.getsizeof(cell) for cell in row)
+        return sys.getsizeof(data) + row_size * len(data)
+
+    if not hasattr(data, 'memory_usage'):
+        return 0
+
+    size = int(data.memory_usage(deep=True).sum())
+    # geometry columns only report their pointer array, so add 16 bytes per coordinate
+    if hasattr(data, 'geometry'):
+        size += int(data.geometry.count_coordinates().sum()) * 16
+    return size
+
+
+_responses = new_store(MEMORY_SIZE, RESPONSE_CACHE_BYTES)
+# Every memoized store, so clear_cache can reach them
+_stores = [_responses]
+
+
+def cache_key(url):
+    # Normalize the query so parameter order and encoding don't matter, and
+    # drop the API key so every user shares the same entry
+    parts = urlsplit(url)
+    params = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() != 'key')
+    normalized = f"{parts.netloc.lower()}{parts.path.rstrip('/')}?{urlencode(params)}"
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def _disk_path(key):
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+
+
+def _read_disk(key):
+    try:
+        with open(_disk_path(key), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_disk(key, data):
+    path = _disk_path(key)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        # atomic swap so concurrent readers never see a partial file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not write census cache entry to {CACHE_DIR}: {e}")
+
+
+def coalesce(store, key, load):
+    # Memory hit, or join a load another thread already has in flight
+    with store['lock']:
+        if key in store['items']:
+            store['items'].move_to_end(key)
+            return store['items'][key]
+
+        future = store['inflight'].get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            store['inflight'][key] = future
+
+    if not owner:
+        return future.result()
+
+    try:
+        data = load()
+        size = nbytes(data) if store['maxbytes'] else 0
+
+        with store['lock']:
+            # anything bigger than the whole budget is handed out but not kept
+            if not store['maxbytes'] or size <= store['maxbytes']:
+                store['items'][key] = data
+                store['sizes'][key] = size
+                store['bytes'] += size
+
+            while len(store['items']) > store['size'] or (store['maxbytes'] and store['bytes'] > store['maxbytes']):
+                old_key, _ = store['items'].popitem(last=False)
+                store['bytes'] -= store['sizes'].pop(old_key)
+        future.set_result(data)
+        return data
+    except BaseException as e:
+        # failures are handed to the waiters but never cached
+        future.set_exception(e)
+        raise
+    finally:
+        with store['lock']:
+            store['inflight'].pop(key, None)
+
+
+def _fetch(url):
+    response = requests.get(url)
+    if response.status_code != 200:
+        raise Exception(f"API request failed with status code {response.status_code}: {response.text}")
+
+    try:
+        return response.json()
+    except ValueError as e:
+        raise Exception(f"Failed to parse JSON response: {e}")
+
+
+def get_json(url, use_cache=True):
+    if not use_cache:
+        return _fetch(url)
+
+    key = cache_key(url)
+
+    def load():
+        data = _read_disk(key)
+        if data is None:
+            data = _fetch(url)
+            _write_disk(key, data)
+        return data
+
+    return coalesce(_responses, key, load)
+
+
+def memoize(maxsize=16, maxbytes=None, copy=True):
+    # Share one in-process result per distinct set of arguments across calls
+    # and threads. With copy=True callers get their own copy; internal readers
+    # whose callers never mutate the result pass copy=False to skip it.
+    def decorator(func):
+        store = new_store(maxsize, maxbytes)
+        _stores.append(store)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = repr((args, sorted(kwargs.items())))
+            result = coalesce(store, key, lambda: func(*args, **kwargs))
+            return result.copy() if copy and hasattr(result, 'copy') else result
+
+        return wrapper
+
+    return decorator
+
+
+def clear_cache(disk=False):
+    for store in _stores:
+        with store['lock']:
+            store['items'].clear()
+            store['sizes'].clear()
+            store['bytes'] = 0
+
+    if disk and os.path.isdir(CACHE_DIR):
+        for root, _, files in os.walk(CACHE_DIR):
+            for name in files:
+                if name.endswith('.json'):
+                    os.remove(os.path.join(root, name))
@@ -1,8 +1,16 @@
 import json
-import pandas as pd
-import geopandas as gpd
-import requests
 import os
+import tempfile
+from functools import lru_cache
+
+from .jt_cache import FRAME_CACHE_BYTES, get_json, memoize
+from .jt_lazy import lazy_import
+from .jt_schema import CENSUS_CATEGORIES, apply_schema, check_backend, to_measure
+
+# Heavy dependencies load on first use; geopandas only once shapes are needed
+pd = lazy_import('pandas')
+gpd = lazy_import('geopandas')
+requests = lazy_import('requests')
 
 
 # Dictionary to store year-specific information
@@ -33,6 +41,7 @@ years_dict = {
     }
 }
 
+@memoize(maxsize=32)
 def vars_dec(year, return_type="short"):
     year = str(year)
     
@@ -53,6 +62,7 @@ def vars_dec(year, return_type="short"):
         raise ValueError("Invalid return_type. Choose either 'long' or 'short'.")
 
 
+@memoize(maxsize=32)
 def vars_acs(year, return_type="short"):
     year = str(year)
     
@@ -75,11 +85,16 @@ def vars_acs(year, return_type="short"):
 
 
 
-def get_fips(state):
+@lru_cache(maxsize=1)
+def load_fips_dict():
     # Safely resolve path relative to this script
     fips_path = os.path.join(os.path.dirname(__file__), "fips_dict.json")
     with open(fips_path, 'r') as f:
-        fips_dict = json.load(f)
+        return json.load(f)
+
+
+def get_fips(state):
+    fips_dict = load_fips_dict()
 
     state_usps, state_name, state_fips, counties = None, None, None, None
 
@@ -106,6 +121,22 @@ def get_fips(state):
     return state_usps, state_name, state_fips, counties
 
 
+# get_tig/get_blocks/get_muni never mutate the cached frame, so no copies
+@memoize(maxsize=8, maxbytes=FRAME_CACHE_BYTES, copy=False)
+def read_tiger(url):
+    response = requests.get(url)
+
+    if response.status_code != 200:
+        raise Exception(f"Failed to download TIGER data with status code {response.status_code}: {response.text}")
+
+    # Unique scratch dir per download so concurrent jobs never clobber each other's zip
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        zip_path = os.path.join(tmp_dir, os.path.basename(url))
+        with open(zip_path, 'wb') as f:
+            f.write(response.content)
+
+        return gpd.read_file(f"zip://{zip_path}")
+
 
 def get_tig(year, state, units='block'):
     if 2001 <= int(year) <= 2009:
@@ -127,41 +158,23 @@ def get_tig(year, state, units='block'):
         tigris_url = year_info['tigris_url'].format(state_fips=state_fips, state_name=state_name)
         geoid_header = year_info['geoid_header']
 
-        response = requests.get(tigris_url)
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to download TIGER data with status code {response.status_code}: {response.text}")
-
-        zip_path = f"{state_fips}_tabblock{year}.zip"
-
     elif units == 'bg':
         tigris_url = f"https://www2.census.gov/geo/tiger/TIGER{year}/{units.upper()}/tl_{year}_{state_fips}_{units.lower()}.zip"
-        
-        response = requests.get(tigris_url)
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to download TIGER data with status code {response.status_code}: {response.text}")
-        
-        zip_path = f"{state_fips}_BG{year}.zip"
-
-
-    with open(zip_path, 'wb') as f:
-        f.write(response.content)
 
-    try:
-        gdf = gpd.read_file(f"zip://{zip_path}")
-    finally:
-        os.remove(zip_path)
+    # Repeat requests for the same state reuse the shapes already loaded
+    gdf = read_tiger(tigris_url)
     
-    if 'tabblock' in zip_path:
+    if units == 'block':
         gdf = gdf.rename(columns={geoid_header: 'GEOID'})
 
-    return gdf
+    # shallow copy so callers can add or replace columns without touching the cache
+    return gdf.copy(deep=False)
 
 
 
-def get_dec(year, state, county, var_group, apikey):
+def get_dec(year, state, county, var_group, apikey, dtype_backend='numpy_nullable', use_cache=True):
     year = str(year)
+    check_backend(dtype_backend)
     
     if year not in years_dict:
         raise ValueError("Sorry -- the only years available here are 2020, 2010, and 2000.")
@@ -197,22 +210,15 @@ def get_dec(year, state, county, var_group, apikey):
     url_template = "https://api.census.gov/data/{year}/dec/{file}?get=group({var_group})&for=block:*&in=state:{state_fips}%20county:{county_fips}&key={apikey}"
     url = url_template.format(year=year, file=file, var_group=var_group, state_fips=state_fips, county_fips=county_fips, apikey=apikey)
    
-    # Pull data from URL
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise Exception(f"API request failed with status code {response.status_code}: {response.text}")
-
-    try:
-        data = response.json()
-    except ValueError as e:
-        raise Exception(f"Failed to parse JSON response: {e}")
+    # Pull data from URL (served from the response cache when possible)
+    data = get_json(url, use_cache)
 
     df = pd.DataFrame(data[1:], columns=data[0])
 
-    # Rename columns
+    # Parse values into the fixed Int32 measure type (Int64 only if a value won't fit)
     for col in df.columns:
         if var_group in col:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            df[col] = to_measure(df[col], dtype_backend)
 
     vars_dict = vars_df.set_index('Name')['Label'].to_dict()
     df = df.rename(columns=vars_dict)
@@ -223,10 +229,15 @@ def get_dec(year, state, county, var_group, apikey):
     df['GEOID'] = df['GEOID'].astype(str)
     df = df.loc[:, ~df.columns.str.contains(var_group)]
     df.columns = df.columns.str.replace('Estimate!!', '').str.replace('!!', '', regex=True).str.replace(' ', '')
+    df = df.loc[:, ~df.columns.duplicated()]
+    df = apply_schema(df, dtype_backend, categories=CENSUS_CATEGORIES, strings=['GEOID'])
 
     # get tigris shapes
     tigris = get_tig(year, state)
 
+    # match key dtypes so the join doesn't have to coerce
+    tigris['GEOID'] = tigris['GEOID'].astype(df['GEOID'].dtype)
+
     # spatialize census data w tigris shapes
     gdf = gpd.GeoDataFrame(df.merge(tigris[['GEOID', 'geometry']], on='GEOID', how='inner'), geometry='geometry', crs=tigris.crs)
     gdf = gdf.loc[:, ~gdf.columns.duplicated()]
@@ -235,8 +246,9 @@ def get_dec(year, state, county, var_group, apikey):
 
 
 
-def get_acs(year, state, county, var_group, apikey):
+def get_acs(year, state, county, var_group, apikey, dtype_backend='numpy_nullable', use_cache=True):
     year = str(year)
+    check_backend(dtype_backend)
 
     # Get FIPS from fips_dict
     state_usps, state_name, state_fips, counties = get_fips(state)
@@ -253,14 +265,14 @@ def get_acs(year, state, county, var_group, apikey):
     if county_fips is None:
         raise ValueError(f"County '{county}' not found in the FIPS dictionary for state '{state_fips}'. Please check the spelling.")
 
-    # Fetch the actual data
-    response = requests.get(f"https://api.census.gov/data/{year}/acs/acs5?get=NAME,group({var_group})&for=block%20group:*&in=state:{state_fips}%20county:{county_fips}&key={apikey}")
-    df = pd.DataFrame(response.json()[1:], columns=response.json()[0])
+    # Fetch the actual data (served from the response cache when possible)
+    data = get_json(f"https://api.census.gov/data/{year}/acs/acs5?get=NAME,group({var_group})&for=block%20group:*&in=state:{state_fips}%20county:{county_fips}&key={apikey}", use_cache)
+    df = pd.DataFrame(data[1:], columns=data[0])
 
     # Convert string columns that contain the 'var' string in their name and are numeric to numbers
     for col in df.columns:
         if var_group in col:  # Check if 'var' string is in the column name
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            df[col] = to_measure(df[col], dtype_backend)
     
     # Create a mapping dictionary from 'Name' to 'Label' and rename the columns using the mapping
     vars_mapping = vars.set_index('Name')['Label'].to_dict()
@@ -272,10 +284,15 @@ def get_acs(year, state, county, var_group, apikey):
     df['GEOID'] = df['GEOID'].astype(str)
     df = df.loc[:, ~df.columns.str.contains(var_group)]
     df.columns = df.columns.str.replace('Estimate!!', '').str.replace('!!', '', regex=True).str.replace(' ', '')
+    df = df.loc[:, ~df.columns.duplicated()]
+    df = apply_schema(df, dtype_backend, categories=CENSUS_CATEGORIES, strings=['GEOID'])
     
     # get tigris shapes
     tigris = get_tig(year, state, units='bg')
 
+    # match key dtypes so the join doesn't have to coerce
+    tigris['GEOID'] = tigris['GEOID'].astype(df['GEOID'].dtype)
+
     # spatialize census data w tigris shapes
     gdf = gpd.GeoDataFrame(df.merge(tigris[['GEOID', 'geometry']], on='GEOID', how='inner'), geometry='geometry', crs=tigris.crs)
     gdf = gdf.loc[:, ~gdf.columns.duplicated()]
@@ -0,0 +1,208 @@
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import yaml
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+from rich.table import Table
+
+from .jt_census import get_acs, get_dec
+from .jt_lehd import fetch_LODES_series, fetch_OD, fetch_WAC
+
+
+# Job types a YAML job file can reference
+JOB_TYPES = {
+    'acs': get_acs,
+    'dec': get_dec,
+    'wac': fetch_WAC,
+    'od': fetch_OD,
+    'lodes_series': fetch_LODES_series
+}
+
+# Job keys that configure the runner rather than the fetch function
+RUNNER_KEYS = ['name', 'type', 'output', 'export']
+
+# Job types whose functions write their own geopackage into the working
+# directory; the runner turns that off and writes 'output' itself
+EXPORTING_TYPES = ['wac', 'od', 'lodes_series']
+
+console = Console()
+
+
+def load_jobs(path):
+    with open(path, 'r') as f:
+        spec = yaml.safe_load(f) or {}
+
+    jobs = spec.get('jobs') or []
+    if not jobs:
+        raise ValueError(f"No jobs found in '{path}'.")
+
+    # API key: job file, then the environment
+    apikey = spec.get('apikey') or os.environ.get('CENSUS_API_KEY')
+
+    for i, job in enumerate(jobs):
+        job_type = job.get('type')
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"Job {i + 1} has invalid type '{job_type}'. Choose from {', '.join(JOB_TYPES)}.")
+
+        job['name'] = str(job.get('name', f"{job_type}_{i + 1}"))
+        if job_type in ['acs', 'dec']:
+            job.setdefault('apikey', apikey)
+
+    # Results and the summary are keyed by name
+    names = [job['name'] for job in jobs]
+    repeated = sorted({name for name in names if names.count(name) > 1})
+    if repeated:
+        raise ValueError(f"Job names must be unique; repeated: {', '.join(repeated)}.")
+
+    return spec, jobs
+
+
+def job_params(job):
+    return {k: v for k, v in job.items() if k not in RUNNER_KEYS}
+
+
+def job_key(job):
+    # Two jobs with the same type and parameters produce the same frame
+    return repr((job['type'], sorted(job_params(job).items())))
+
+
+def schedule(jobs):
+    # Group identical jobs so each frame is computed once, then order the groups
+    # so jobs hitting the same state and year sit next to each other and reuse
+    # the warm caches
+    groups = {}
+    for job in jobs:
+        groups.setdefault(job_key(job), []).append(job)
+
+    return sorted(groups.values(), key=lambda group: (str(group[0].get('state', '')).lower(), str(group[0].get('year', ''))))
+
+
+def fetch_job(job):
+    params = job_params(job)
+    if job['type'] in EXPORTING_TYPES:
+        params['export'] = False
+    result = JOB_TYPES[job['type']](**params)
+
+    if result is None:
+        raise Exception("Job returned no data; see the log above for details.")
+    return result
+
+
+def write_output(result, output, output_dir):
+    if not output:
+        return
+
+    output = os.path.join(output_dir, output)
+    if output.endswith('.parquet'):
+        result.to_parquet(output)
+    else:
+        result.to_file(output, driver='GPKG')
+
+
+def run_group(group, output_dir):
+    # Compute the shared frame once; every job in the group still writes its
+    # own output and gets its own status
+    start = time.perf_counter()
+    result = fetch_job(group[0])
+    first = group[0]['name']
+    results = {}
+
+    for job in group:
+        write_start = time.perf_counter()
+        try:
+            write_output(result, job.get('output'), output_dir)
+        except Exception as e:
+            results[job['name']] = ('failed', None, None, str(e))
+            continue
+
+        if job['name'] == first:
+            results[job['name']] = ('ok', len(result), time.perf_counter() - start, '')
+        else:
+            results[job['name']] = ('ok', len(result), time.perf_counter() - write_start, f"duplicate of {first}")
+
+    return results
+
+
+def run_jobs(jobs, workers=4, output_dir='.'):
+    groups = schedule(jobs)
+    os.makedirs(output_dir, exist_ok=True)
+    results = {}
+
+    progress = Progress(
+        TextColumn("[bold]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console
+    )
+
+    # Threads, not processes: the downloads are I/O bound and every job shares
+    # the in-process caches for TIGER shapes, LODES files and API responses
+    with progress, ThreadPoolExecutor(max_workers=workers) as pool:
+        task = progress.add_task("Running jobs", total=len(jobs))
+        futures = {pool.submit(run_group, group, output_dir): group for group in groups}
+
+        for future in as_completed(futures):
+            group = futures[future]
+            try:
+                results.update(future.result())
+            except Exception as e:
+                # the shared frame failed, so every job in the group did
+                for job in group:
+                    results[job['name']] = ('failed', None, None, str(e))
+            progress.advance(task, len(group))
+
+    return results
+
+
+def print_summary(jobs, results):
+    table = Table(title="Job timings")
+    table.add_column("Job")
+    table.add_column("Type")
+    table.add_column("Status")
+    table.add_column("Rows", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Notes")
+
+    for job in jobs:
+        status, rows, seconds, note = results[job['name']]
+        style = "green" if status == 'ok' else "red"
+        table.add_row(
+            job['name'],
+            job['type'],
+            f"[{style}]{status}[/{style}]",
+            "" if rows is None else f"{rows:,}",
+            "" if seconds is None else f"{seconds:.1f}",
+            note
+        )
+
+    console.print(table)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="census", description="Run a batch of census and LODES jobs from a YAML job file.")
+    parser.add_argument("jobfile", help="YAML file with a top-level 'jobs' list")
+    parser.add_argument("-w", "--workers", type=int, help="number of worker threads (default: job file 'workers' or 4)")
+    parser.add_argument("-o", "--output-dir", help="directory for job outputs (default: job file 'output_dir' or '.')")
+    args = parser.parse_args(argv)
+
+    try:
+        spec, jobs = load_jobs(args.jobfile)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        console.print(f"[red]Invalid job file:[/red] {e}")
+        return 2
+    workers = args.workers or spec.get('workers', 4)
+    output_dir = args.output_dir or spec.get('output_dir', '.')
+
+    results = run_jobs(jobs, workers=workers, output_dir=output_dir)
+    print_summary(jobs, results)
+
+    failed = [name for name, result in results.items() if result[0] != 'ok']
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,13 +1,181 @@
-import pandas as pd
-import geopandas as gpd
-import numpy as np
-import requests
 import re
-import json
-import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import the canonical version of get_fips from jt_census.py
-from src.census.jt_census import get_fips
+from .jt_cache import FRAME_CACHE_BYTES, memoize
+from .jt_census import get_fips, load_fips_dict, read_tiger
+from .jt_lazy import lazy_import
+from .jt_schema import apply_schema, check_backend, lodes_dtypes, measure_dtype
+
+# Heavy dependencies load on first use; geopandas only once shapes are needed
+pd = lazy_import('pandas')
+gpd = lazy_import('geopandas')
+requests = lazy_import('requests')
+
+
+# States published in LODES8
+LODES_states = [
+    'ak', 'al', 'ar', 'az', 'ca', 'co', 'ct', 'dc', 'de', 'fl', 'ga',
+    'hi', 'ia', 'id', 'il', 'in', 'ks', 'ky', 'la', 'ma', 'md', 'me',
+    'mi', 'mn', 'mo', 'ms', 'mt', 'nc', 'nd', 'ne', 'nh', 'nj', 'nm',
+    'nv', 'ny', 'oh', 'ok', 'or', 'pa', 'ri', 'sc', 'sd', 'tn', 'tx',
+    'ut', 'va', 'vt', 'wa', 'wi', 'wv', 'wy'
+]
+
+# WAC column codes, descriptions and short labels. RAC files carry the same
+# codes (minus the firm age/size columns) keyed on h_geocode instead.
+WAC_variables = {
+    "Variable": [
+        "w_geocode", "C000", "CA01", "CA02", "CA03", "CE01", "CE02", "CE03",
+        "CNS01", "CNS02", "CNS03", "CNS04", "CNS05", "CNS06", "CNS07", "CNS08",
+        "CNS09", "CNS10", "CNS11", "CNS12", "CNS13", "CNS14", "CNS15", "CNS16",
+        "CNS17", "CNS18", "CNS19", "CNS20", "CR01", "CR02", "CR03", "CR04",
+        "CR05", "CR07", "CT01", "CT02", "CD01", "CD02", "CD03", "CD04", "CS01",
+        "CS02", "CFA01", "CFA02", "CFA03", "CFA04", "CFA05", "CFS01", "CFS02",
+        "CFS03", "CFS04", "CFS05", "createdate"
+    ],
+
+    "Explanation": [
+        "Workplace Census Block Code",
+        "Total number of jobs",
+        "Number of jobs for workers age 29 or younger",
+        "Number of jobs for workers age 30 to 54",
+        "Number of jobs for workers age 55 or older",
+        "Number of jobs with earnings $1250/month or less",
+        "Number of jobs with earnings $1251/month to $3333/month",
+        "Number of jobs with earnings greater than $3333/month",
+        "Number of jobs in NAICS sector 11 (Agriculture, Forestry, Fishing and Hunting)",
+        "Number of jobs in NAICS sector 21 (Mining, Quarrying, and Oil and Gas Extraction)",
+        "Number of jobs in NAICS sector 22 (Utilities)",
+        "Number of jobs in NAICS sector 23 (Construction)",
+        "Number of jobs in NAICS sector 31-33 (Manufacturing)",
+        "Number of jobs in NAICS sector 42 (Wholesale Trade)",
+        "Number of jobs in NAICS sector 44-45 (Retail Trade)",
+        "Number of jobs in NAICS sector 48-49 (Transportation and Warehousing)",
+        "Number of jobs in NAICS sector 51 (Information)",
+        "Number of jobs in NAICS sector 52 (Finance and Insurance)",
+        "Number of jobs in NAICS sector 53 (Real Estate and Rental and Leasing)",
+        "Number of jobs in NAICS sector 54 (Professional, Scientific, and Technical Services)",
+        "Number of jobs in NAICS sector 55 (Management of Companies and Enterprises)",
+        "Number of jobs in NAICS sector 56 (Administrative and Support and Waste Management and Remediation Services)",
+        "Number of jobs in NAICS sector 61 (Educational Services)",
+        "Number of jobs in NAICS sector 62 (Health Care and Social Assistance)",
+        "Number of jobs in NAICS sector 71 (Arts, Entertainment, and Recreation)",
+        "Number of jobs in NAICS sector 72 (Accommodation and Food Services)",
+        "Number of jobs in NAICS sector 81 (Other Services [except Public Administration])",
+        "Number of jobs in NAICS sector 92 (Public Administration)",
+        "Number of jobs for workers with Race: White, Alone10",
+        "Number of jobs for workers with Race: Black or African American Alone",
+        "Number of jobs for workers with Race: American Indian or Alaska Native Alone",
+        "Number of jobs for workers with Race: Asian Alone10",
+        "Number of jobs for workers with Race: Native Hawaiian or Other Pacific Islander Alone",
+        "Number of jobs for workers with Race: Two or More Race Groups",
+        "Number of jobs for workers with Ethnicity: Not Hispanic or Latino",
+        "Number of jobs for workers with Ethnicity: Hispanic or Latino",
+        "Number of jobs for workers with Educational Attainment: Less than high school",
+        "Number of jobs for workers with Educational Attainment: High school or equivalent, no college",
+        "Number of jobs for workers with Educational Attainment: Some college or Associate degree",
+        "Number of jobs for workers with Educational Attainment: Bachelor's degree or advanced degree",
+        "Number of jobs for workers with Sex: Male",
+        "Number of jobs for workers with Sex: Female",
+        "Number of jobs for workers at firms with Firm Age: 0-1 Years",
+        "Number of jobs for workers at firms with Firm Age: 2-3 Years",
+        "Number of jobs for workers at firms with Firm Age: 4-5 Years",
+        "Number of jobs for workers at firms with Firm Age: 6-10 Years",
+        "Number of jobs for workers at firms with Firm Age: 11+ Years",
+        "Number of jobs for workers at firms with Firm Size: 0-19 Employees",
+        "Number of jobs for workers at firms with Firm Size: 20-49 Employees",
+        "Number of jobs for workers at firms with Firm Size: 50-249 Employees",
+        "Number of jobs for workers at firms with Firm Size: 250-499 Employees",
+        "Number of jobs for workers at firms with Firm Size: 500+ Employees",
+        "Date on which data was created, formatted as YYYYMMDD"
+    ],
+
+    "Label": [
+        "GEOID",
+        "Total",
+        "age_<=29",
+        "age_30_to_54",
+        "age_55+",
+        "monthly_earnings_<=$1250",
+        "monthly_earnings_$1251_to_$3333",
+        "monthly_earnings_$3333+",
+        "sector_Agriculture_Forestry_Fishing_Hunting",
+        "sector_Mining_Quarrying_Oil_Gas",
+        "sector_Utilities",
+        "sector_Construction",
+        "sector_Manufacturing",
+        "sector_WholesaleTrade",
+        "sector_Retail Trade",
+        "sector_Transportation_Warehousing",
+        "sector_Information",
+        "sector_Finance_Insurance",
+        "sector_RealEstateRentalLeasing",
+        "sector_ProfessionalScientificTechnicalServices",
+        "sector_ManagementCompaniesEnterprises",
+        "sector_WasteManagement&Remediation Services",
+        "sector_EducationalServices",
+        "sector_Healthcare&SocialAssistance",
+        "sector_ArtsEntertainmentRecreation)",
+        "sector_Accommodation&FoodServices)",
+        "sector_Other_ExceptPublicAdmin",
+        "Sector_Public_Admin",
+        "race_white",
+        "race_Black",
+        "race_AmericanIndian",
+        "race_Asian",
+        "race_Hawaiian",
+        "race_multiracial",
+        "ethnicity_NonLatino",
+        "ethnicity_Latino",
+        "edu_<HS",
+        "edu_HSorGED",
+        "edu_SomeCollege",
+        "edu_Bach+",
+        "sex_M",
+        "sex_F",
+        "firm_0to1yr_old",
+        "firm_2to3yr_old",
+        "firm_4to5yr_old",
+        "firm_6to10yr_old",
+        "firm_11+yr_old",
+        "firm_size_0to19ppl",
+        "firm_size_20to49ppl",
+        "firm_size_50to249ppl",
+        "firm_size_250to499ppl",
+        "firm_size_500+ppl",
+        "Date"
+    ]
+}
+
+LODES_labels = dict(zip(WAC_variables['Variable'], WAC_variables['Label']))
+LODES_labels['h_geocode'] = 'GEOID'
+
+
+@memoize(maxsize=64, maxbytes=FRAME_CACHE_BYTES, copy=False)
+def read_lodes(url, dtype_backend='numpy_nullable'):
+    # OD aux files are shared by every fetch_OD call for a year, so keep them warm.
+    # Counts are parsed straight into Int32, geocodes and dates as strings, so
+    # the cache holds the compact frame. Callers rename/concat rather than mutate.
+    return pd.read_csv(url, compression='gzip', dtype=lodes_dtypes(dtype_backend))
+
+
+@memoize(maxsize=128)
+def lodes_catalog(state, kind='wac'):
+    # Scrape a state's wac/ or rac/ directory listing once and index the files
+    # as {(segment, job_type): [years]}
+    state = state.lower()
+    base_url = f"https://lehd.ces.census.gov/data/lodes/LODES8/{state}/{kind}/"
+
+    response = requests.get(base_url)
+    if response.status_code != 200:
+        raise Exception(f"Failed to access {kind.upper()} directory for {state} with status code {response.status_code}")
+
+    catalog = {}
+    for segment, job_type, year in set(re.findall(fr"{state}_{kind}_(\w+?)_(JT\d\d)_(\d{{4}})\.csv\.gz", response.text)):
+        catalog.setdefault((segment, job_type), []).append(int(year))
+
+    return {key: sorted(years) for key, years in catalog.items()}
 
 
 def get_blocks(year, states):
@@ -15,8 +183,7 @@ def get_blocks(year, states):
     year = int(year)
 
     # Load the FIPS dictionary from 'fips_dict.json' file
-    with open('jt_census/fips_dict.json', 'r') as f:
-        fips_dict = json.load(f)
+    fips_dict = load_fips_dict()
 
     # Define the URL and GEOID header based on the year
     if year < 2010:
@@ -66,30 +233,15 @@ def get_blocks(year, states):
         # Construct the URL for the current state
         tigris_url = url_template.format(state_fips=state_fips, state_name=state_name)
 
-        # Fetch the data from the URL
+        # Fetch the data from the URL (reuses shapes already loaded for this state)
         try:
-            response = requests.get(tigris_url)
-            if response.status_code != 200:
-                print(f"Failed to download data for {state_name} ({state_input}) with status code {response.status_code}")
-                continue
-
-            # Save the downloaded zip file
-            zip_path = f"{state_fips}_tabblock{year}.zip"
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
-
-            # Read the shapefile from the zip archive
-            try:
-                gdf = gpd.read_file(f"zip://{zip_path}")
-                # Rename the geoid column to 'GEOID'
-                gdf = gdf.rename(columns={geoid_header: 'GEOID'})
-
-                # Add the GeoDataFrame to the list
-                gdfs.append(gdf)
-                print(f"Fetched block shapes for {state_name} ({state_input})")
+            gdf = read_tiger(tigris_url)
+            # Rename the geoid column to 'GEOID'
+            gdf = gdf.rename(columns={geoid_header: 'GEOID'})
 
-            finally:
-                os.remove(zip_path)  # Remove the zip file after reading
+            # Add the GeoDataFrame to the list
+            gdfs.append(gdf)
+            print(f"Fetched block shapes for {state_name} ({state_input})")
 
         except Exception as e:
             print(f"Error fetching data for {state_name} ({state_input}): {e}")
@@ -111,47 +263,28 @@ def get_muni(muni, state):
 
     # Fetch the COUSUB data
     try:
-        response = requests.get(cousub_url)
-        if response.status_code != 200:
-            raise Exception(f"Failed to download county subdivision data with status code {response.status_code}")
+        gdf = read_tiger(cousub_url)
 
-        # Save the downloaded zip file
-        zip_path = f"{state_fips}_cousub.zip"
-        with open(zip_path, 'wb') as f:
-            f.write(response.content)
+        # Filter by the 'NAME' column to match the input 'muni', case-insensitive
+        muni_gdf = gdf[gdf['NAME'].str.strip().str.lower() == muni.strip().lower()]
 
-        # Read the shapefile from the zip archive
-        try:
-            gdf = gpd.read_file(f"zip://{zip_path}")
-
-            # Filter by the 'NAME' column to match the input 'muni', case-insensitive
-            muni_gdf = gdf[gdf['NAME'].str.strip().str.lower() == muni.strip().lower()]
-
-            if muni_gdf.empty:
-                raise ValueError(f"No match found for municipality '{muni}' in state '{state}'.")
-
-            print(f"Successfully extracted municipality '{muni}' from the county subdivision file.")
-            return muni_gdf
+        if muni_gdf.empty:
+            raise ValueError(f"No match found for municipality '{muni}' in state '{state}'.")
 
-        finally:
-            os.remove(zip_path)  # Remove the zip file after reading
+        print(f"Successfully extracted municipality '{muni}' from the county subdivision file.")
+        return muni_gdf
 
     except Exception as e:
         print(f"Error fetching or processing county subdivision data for {state}: {e}")
 
     
-def fetch_OD(muni, state, year, direction):
+def fetch_OD(muni, state, year, direction, dtype_backend='numpy_nullable', export=True):
     # Convert state to lowercase
     state = state.lower()
+    check_backend(dtype_backend)
 
     # Define valid states and year range
-    valid_states = [
-        'ak', 'al', 'ar', 'az', 'ca', 'co', 'ct', 'dc', 'de', 'fl', 'ga',
-        'hi', 'ia', 'id', 'il', 'in', 'ks', 'ky', 'la', 'ma', 'md', 'me',
-        'mi', 'mn', 'mo', 'ms', 'mt', 'nc', 'nd', 'ne', 'nh', 'nj', 'nm',
-        'nv', 'ny', 'oh', 'ok', 'or', 'pa', 'ri', 'sc', 'sd', 'tn', 'tx',
-        'ut', 'va', 'vt', 'wa', 'wi', 'wv', 'wy'
-    ]
+    valid_states = LODES_states
     valid_years = range(2003, 2022)
 
     # Check for valid state
@@ -170,7 +303,7 @@ def fetch_OD(muni, state, year, direction):
     # Fetch main dataset for the input state
     main_url = fr"https://lehd.ces.census.gov/data/lodes/LODES8/{state}/od/{state}_od_main_JT00_{year}.csv.gz"
     try:
-        main_df = pd.read_csv(main_url, compression='gzip')
+        main_df = read_lodes(main_url, dtype_backend)
         dfs.append(main_df)
         print(f"Fetched main dataset for {state}.")
     except Exception as e:
@@ -180,7 +313,7 @@ def fetch_OD(muni, state, year, direction):
     for s in valid_states:
         aux_url = fr"https://lehd.ces.census.gov/data/lodes/LODES8/{s}/od/{s}_od_aux_JT00_{year}.csv.gz"
         try:
-            aux_df = pd.read_csv(aux_url, compression='gzip')
+            aux_df = read_lodes(aux_url, dtype_backend)
             dfs.append(aux_df)
             print(f"Fetched aux dataset for {s}.")
         except Exception as e:
@@ -190,12 +323,9 @@ def fetch_OD(muni, state, year, direction):
     if dfs:
         combined_df = pd.concat(dfs, ignore_index=True)
 
-        # Convert specific columns to string type
-        combined_df = combined_df.astype({'w_geocode': str, 'h_geocode': str})
-
         # Ensure 15-digit geocodes by adding a leading '0' if needed
         for col in ['w_geocode', 'h_geocode']:
-            combined_df[col] = combined_df[col].apply(lambda x: '0' + x if len(x) == 14 else x)
+            combined_df[col] = combined_df[col].str.zfill(15)
 
         # Define the mapping of original column names to new labels
         OD_code_map = {
@@ -217,6 +347,12 @@ def fetch_OD(muni, state, year, direction):
         # Rename columns based on the mapping dictionary
         combined_df.rename(columns=OD_code_map, inplace=True)
 
+        # Counts and geocodes were typed at parse time; only the dates are left
+        count_cols = [label for code, label in OD_code_map.items() if code.startswith('S')]
+        combined_df = apply_schema(combined_df, dtype_backend, dates=['createdate'])
+        # Sum job counts per block; keep the most recent createdate
+        agg_map = {**{col: 'sum' for col in count_cols}, 'createdate': 'max'}
+
         # fetch municipality boundaries
         muni_gdf = get_muni(muni, state)
         # fetch state blocks
@@ -231,11 +367,11 @@ def fetch_OD(muni, state, year, direction):
         print("Number of workers from municipality:", len(From_muni))
         # group this data by unique destination GEOID
         From_muni_sum = From_muni.drop('h_GEOID', axis=1)
-        From_muni_sum = From_muni_sum.groupby('w_GEOID').sum().reset_index()
+        From_muni_sum = From_muni_sum.groupby('w_GEOID').agg(agg_map).reset_index()
+        From_muni_sum = apply_schema(From_muni_sum, dtype_backend, counts=count_cols)
         print("Number of destination blocks of workers from municipality:", len(From_muni_sum))
         # get list of states where these destination blocks are
-        From_muni_sum['fips'] = From_muni_sum['w_GEOID'].str[:2]
-        From_states = From_muni_sum['fips'].unique().tolist()
+        From_states = From_muni_sum['w_GEOID'].str[:2].unique().tolist()
         print("Number of states where workers in municipality are commuting from:", len(From_muni_sum))
 
         # scan w_GEOID (DESTINATION) for GEOIDs in list of blocks within municipality
@@ -243,11 +379,11 @@ def fetch_OD(muni, state, year, direction):
         print("Number of workers w jobs in municipality:", len(To_muni))
         # group this data by unique origin GEOID
         To_muni_sum = To_muni.drop('w_GEOID', axis=1)
-        To_muni_sum = To_muni_sum.groupby('h_GEOID').sum().reset_index()
+        To_muni_sum = To_muni_sum.groupby('h_GEOID').agg(agg_map).reset_index()
+        To_muni_sum = apply_schema(To_muni_sum, dtype_backend, counts=count_cols)
         print("Number of origin blocks of workers to municipality:", len(To_muni_sum))
         # get list of states where these origin blocks are
-        To_muni_sum['fips'] = To_muni_sum['h_GEOID'].str[:2]
-        To_states = To_muni_sum['fips'].unique().tolist()
+        To_states = To_muni_sum['h_GEOID'].str[:2].unique().tolist()
         print("Number of states where workers from municipality are commuting to:", len(From_muni_sum))
 
         # create list of all states that show up across the To and From datasets
@@ -257,7 +393,7 @@ def fetch_OD(muni, state, year, direction):
         # grab all block polygons across USA 
         # (need to brainstorm more efficient approach -- get list of all unique first 2 digits of GEOID to get list of states...)
         all_blocks = get_blocks(year, all_states)
-        all_blocks['GEOID'] = all_blocks['GEOID'].astype(str)
+        all_blocks['GEOID'] = all_blocks['GEOID'].astype(combined_df['w_GEOID'].dtype)
 
         # merge (i.e. join) the From_muni and To_muni datasets to their block shapes
         print("joining dataframes to their block shapes...")
@@ -266,10 +402,12 @@ def fetch_OD(muni, state, year, direction):
 
         # Export and return based on direction
         if direction == "from":
-            From_muni_gdf.to_file(f"From_{muni}.gpkg", driver='GPKG')
+            if export:
+                From_muni_gdf.to_file(f"From_{muni}.gpkg", driver='GPKG')
             return From_muni_gdf
         elif direction == "to":
-            To_muni_gdf.to_file(f"To_{muni}.gpkg", driver='GPKG')
+            if export:
+                To_muni_gdf.to_file(f"To_{muni}.gpkg", driver='GPKG')
             return To_muni_gdf
         else:
             print("Invalid direction. Use 'from' or 'to'.")
@@ -279,18 +417,13 @@ def fetch_OD(muni, state, year, direction):
 
 
 
-def fetch_WAC(muni, state, year):
+def fetch_WAC(muni, state, year, dtype_backend='numpy_nullable', export=True):
     # Convert state to lowercase
     state = state.lower()
+    check_backend(dtype_backend)
 
     # Define valid states and year range
-    valid_states = [
-        'ak', 'al', 'ar', 'az', 'ca', 'co', 'ct', 'dc', 'de', 'fl', 'ga',
-        'hi', 'ia', 'id', 'il', 'in', 'ks', 'ky', 'la', 'ma', 'md', 'me',
-        'mi', 'mn', 'mo', 'ms', 'mt', 'nc', 'nd', 'ne', 'nh', 'nj', 'nm',
-        'nv', 'ny', 'oh', 'ok', 'or', 'pa', 'ri', 'sc', 'sd', 'tn', 'tx',
-        'ut', 'va', 'vt', 'wa', 'wi', 'wv', 'wy'
-    ]
+    valid_states = LODES_states
     valid_years = range(2003, 2022)
 
     # Check for valid state
@@ -301,18 +434,17 @@ def fetch_WAC(muni, state, year):
     base_url = f"https://lehd.ces.census.gov/data/lodes/LODES8/{state}/wac/"
     
     try:
-        html = requests.get(base_url).text
+        catalog = lodes_catalog(state, 'wac')
     except Exception as e:
         print(f"Failed to access WAC directory for {state}: {e}")
         return None
 
-    # Extract all valid years from filenames
-    matches = re.findall(fr"{state}_wac_S000_JT00_(\d{{4}}).csv.gz", html)
-    if not matches:
+    # Years available for the all-jobs file, from the cached directory listing
+    available_years = catalog.get(('S000', 'JT00'), [])
+    if not available_years:
         print("No WAC files found for this state.")
         return None
 
-    available_years = sorted(set(int(m) for m in matches))
     latest_year = available_years[-1]
 
     if year == "latest":
@@ -326,145 +458,24 @@ def fetch_WAC(muni, state, year):
 
     file_url = f"{base_url}{state}_wac_S000_JT00_{year}.csv.gz"
     try:
-        main_df = pd.read_csv(file_url, compression='gzip')
+        main_df = read_lodes(file_url, dtype_backend)
         print(f"Fetched main dataset for {state}, year {year}.")
     except Exception as e:
         print(f"Failed to fetch WAC dataset for {state} in {year}: {e}")
         return None
     
-    WAC_variables = {
-        "Variable": [
-            "w_geocode", "C000", "CA01", "CA02", "CA03", "CE01", "CE02", "CE03",
-            "CNS01", "CNS02", "CNS03", "CNS04", "CNS05", "CNS06", "CNS07", "CNS08",
-            "CNS09", "CNS10", "CNS11", "CNS12", "CNS13", "CNS14", "CNS15", "CNS16",
-            "CNS17", "CNS18", "CNS19", "CNS20", "CR01", "CR02", "CR03", "CR04",
-            "CR05", "CR07", "CT01", "CT02", "CD01", "CD02", "CD03", "CD04", "CS01",
-            "CS02", "CFA01", "CFA02", "CFA03", "CFA04", "CFA05", "CFS01", "CFS02",
-            "CFS03", "CFS04", "CFS05", "createdate"
-        ],
-    
-        "Explanation": [
-            "Workplace Census Block Code",
-            "Total number of jobs",
-            "Number of jobs for workers age 29 or younger",
-            "Number of jobs for workers age 30 to 54",
-            "Number of jobs for workers age 55 or older",
-            "Number of jobs with earnings $1250/month or less",
-            "Number of jobs with earnings $1251/month to $3333/month",
-            "Number of jobs with earnings greater than $3333/month",
-            "Number of jobs in NAICS sector 11 (Agriculture, Forestry, Fishing and Hunting)",
-            "Number of jobs in NAICS sector 21 (Mining, Quarrying, and Oil and Gas Extraction)",
-            "Number of jobs in NAICS sector 22 (Utilities)",
-            "Number of jobs in NAICS sector 23 (Construction)",
-            "Number of jobs in NAICS sector 31-33 (Manufacturing)",
-            "Number of jobs in NAICS sector 42 (Wholesale Trade)",
-            "Number of jobs in NAICS sector 44-45 (Retail Trade)",
-            "Number of jobs in NAICS sector 48-49 (Transportation and Warehousing)",
-            "Number of jobs in NAICS sector 51 (Information)",
-            "Number of jobs in NAICS sector 52 (Finance and Insurance)",
-            "Number of jobs in NAICS sector 53 (Real Estate and Rental and Leasing)",
-            "Number of jobs in NAICS sector 54 (Professional, Scientific, and Technical Services)",
-            "Number of jobs in NAICS sector 55 (Management of Companies and Enterprises)",
-            "Number of jobs in NAICS sector 56 (Administrative and Support and Waste Management and Remediation Services)",
-            "Number of jobs in NAICS sector 61 (Educational Services)",
-            "Number of jobs in NAICS sector 62 (Health Care and Social Assistance)",
-            "Number of jobs in NAICS sector 71 (Arts, Entertainment, and Recreation)",
-            "Number of jobs in NAICS sector 72 (Accommodation and Food Services)",
-            "Number of jobs in NAICS sector 81 (Other Services [except Public Administration])",
-            "Number of jobs in NAICS sector 92 (Public Administration)",
-            "Number of jobs for workers with Race: White, Alone10",
-            "Number of jobs for workers with Race: Black or African American Alone",
-            "Number of jobs for workers with Race: American Indian or Alaska Native Alone",
-            "Number of jobs for workers with Race: Asian Alone10",
-            "Number of jobs for workers with Race: Native Hawaiian or Other Pacific Islander Alone",
-            "Number of jobs for workers with Race: Two or More Race Groups",
-            "Number of jobs for workers with Ethnicity: Not Hispanic or Latino",
-            "Number of jobs for workers with Ethnicity: Hispanic or Latino",
-            "Number of jobs for workers with Educational Attainment: Less than high school",
-            "Number of jobs for workers with Educational Attainment: High school or equivalent, no college",
-            "Number of jobs for workers with Educational Attainment: Some college or Associate degree",
-            "Number of jobs for workers with Educational Attainment: Bachelor's degree or advanced degree",
-            "Number of jobs for workers with Sex: Male",
-            "Number of jobs for workers with Sex: Female",
-            "Number of jobs for workers at firms with Firm Age: 0-1 Years",
-            "Number of jobs for workers at firms with Firm Age: 2-3 Years",
-            "Number of jobs for workers at firms with Firm Age: 4-5 Years",
-            "Number of jobs for workers at firms with Firm Age: 6-10 Years",
-            "Number of jobs for workers at firms with Firm Age: 11+ Years",
-            "Number of jobs for workers at firms with Firm Size: 0-19 Employees",
-            "Number of jobs for workers at firms with Firm Size: 20-49 Employees",
-            "Number of jobs for workers at firms with Firm Size: 50-249 Employees",
-            "Number of jobs for workers at firms with Firm Size: 250-499 Employees",
-            "Number of jobs for workers at firms with Firm Size: 500+ Employees",
-            "Date on which data was created, formatted as YYYYMMDD"
-        ],
-
-        "Label": [
-            "GEOID",
-            "Total",
-            "age_<=29",
-            "age_30_to_54",
-            "age_55+",
-            "monthly_earnings_<=$1250",
-            "monthly_earnings_$1251_to_$3333",
-            "monthly_earnings_$3333+",
-            "sector_Agriculture_Forestry_Fishing_Hunting",
-            "sector_Mining_Quarrying_Oil_Gas",
-            "sector_Utilities",
-            "sector_Construction",
-            "sector_Manufacturing",
-            "sector_WholesaleTrade",
-            "sector_Retail Trade",
-            "sector_Transportation_Warehousing",
-            "sector_Information",
-            "sector_Finance_Insurance",
-            "sector_RealEstateRentalLeasing",
-            "sector_ProfessionalScientificTechnicalServices",
-            "sector_ManagementCompaniesEnterprises",
-            "sector_WasteManagement&Remediation Services",
-            "sector_EducationalServices",
-            "sector_Healthcare&SocialAssistance",
-            "sector_ArtsEntertainmentRecreation)",
-            "sector_Accommodation&FoodServices)",
-            "sector_Other_ExceptPublicAdmin",
-            "Sector_Public_Admin",
-            "race_white",
-            "race_Black",
-            "race_AmericanIndian",
-            "race_Asian",
-            "race_Hawaiian",
-            "race_multiracial",
-            "ethnicity_NonLatino",
-            "ethnicity_Latino",
-            "edu_<HS",
-            "edu_HSorGED",
-            "edu_SomeCollege",
-            "edu_Bach+",
-            "sex_M",
-            "sex_F",
-            "firm_0to1yr_old",
-            "firm_2to3yr_old",
-            "firm_4to5yr_old",
-            "firm_6to10yr_old",
-            "firm_11+yr_old",
-            "firm_size_0to19ppl",
-            "firm_size_20to49ppl",
-            "firm_size_50to249ppl",
-            "firm_size_250to499ppl",
-            "firm_size_500+ppl",
-            "Date"
-        ]
-    }
     # Create DataFrame for WAC variables
     WAC_dictionary = pd.DataFrame(WAC_variables)
     # Use the 'Variable' column as the index to directly map 'Label' values for renaming
-    main_df.rename(columns=WAC_dictionary.set_index('Variable')['Label'].to_dict(), inplace=True)
-    main_df['GEOID'] = main_df['GEOID'].astype(str)
+    main_df = main_df.rename(columns=WAC_dictionary.set_index('Variable')['Label'].to_dict())
     # find more elegant approach to above step (right now it's dictionary to df and back to dictionary)
 
+    # Counts and GEOID were typed at parse time; only the dates are left
+    main_df = apply_schema(main_df, dtype_backend, dates=['Date'])
+
     # fetch blocks shapes
     state_blocks = get_blocks(2021, [state])
-    state_blocks['GEOID'] = state_blocks['GEOID'].astype(str)
+    state_blocks['GEOID'] = state_blocks['GEOID'].astype(main_df['GEOID'].dtype)
 
     # Join WAC data to block shapes
     state_blocks = state_blocks.merge(main_df, left_on='GEOID', right_on='GEOID', how='left')
@@ -478,6 +489,122 @@ def fetch_WAC(muni, state, year):
     muni_blocks.insert(1, 'municipality', muni.upper())
 
     # export to geopackage
-    muni_blocks.to_file(f"WAC_{muni}.gpkg", driver='GPKG')
+    if export:
+        muni_blocks.to_file(f"WAC_{muni}.gpkg", driver='GPKG')
+
+    return muni_blocks
+
+
+
+def fetch_LODES_series(muni, state, start_year, end_year=None, kind='wac', segments=('S000',), job_types=('JT00',), shape='long', max_workers=8, dtype_backend='numpy_nullable', export=True):
+    # Convert state to lowercase
+    state = state.lower()
+    kind = kind.lower()
+    check_backend(dtype_backend)
+
+    # Check for valid state, file kind and output shape
+    if state not in LODES_states:
+        print("State not found. Please make sure to use a valid 2-letter state abbreviation.")
+        return None
+
+    if kind not in ['wac', 'rac']:
+        raise ValueError("Invalid kind. Choose either 'wac' or 'rac'.")
+
+    if shape not in ['long', 'wide']:
+        raise ValueError("Invalid shape. Choose either 'long' or 'wide'.")
+
+    try:
+        catalog = lodes_catalog(state, kind)
+    except Exception as e:
+        print(f"Failed to access {kind.upper()} directory for {state}: {e}")
+        return None
+
+    # Resolve every (segment, job type, year) in range against the catalog
+    base_url = f"https://lehd.ces.census.gov/data/lodes/LODES8/{state}/{kind}/"
+    files = []
+    for segment in segments:
+        for job_type in job_types:
+            available_years = catalog.get((segment, job_type), [])
+            last_year = end_year if end_year is not None else max(available_years, default=start_year)
+            years = [year for year in available_years if start_year <= year <= last_year]
+            missing = sorted(set(range(start_year, last_year + 1)) - set(years))
+            if missing:
+                print(f"No {kind.upper()} {segment}/{job_type} file for {state} in {missing}. Skipping those years.")
+            for year in years:
+                files.append((segment, job_type, year, f"{base_url}{state}_{kind}_{segment}_{job_type}_{year}.csv.gz"))
+
+    if not files:
+        print(f"No {kind.upper()} files found for {state} between {start_year} and {end_year or 'latest'}.")
+        return None
+
+    # Look up the municipality before starting any downloads
+    muni_gdf = get_muni(muni, state)
+    if muni_gdf is None:
+        print(f"Municipality '{muni}' not found; cannot build the {kind.upper()} series.")
+        return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Start the CSV downloads, then load the block shapes once while they
+        # run. LODES8 is keyed to 2020 blocks for every year.
+        futures = {pool.submit(read_lodes, url, dtype_backend): (segment, job_type, year) for segment, job_type, year, url in files}
+        try:
+            state_blocks = get_blocks(2020, [state])
+        except Exception:
+            # don't sit through the queued downloads on the way out
+            pool.shutdown(cancel_futures=True)
+            raise
+
+        muni_blocks = gpd.clip(state_blocks[['GEOID', 'geometry']], muni_gdf)
+        muni_blocks['GEOID'] = muni_blocks['GEOID'].astype(str)
+        muni_GEOIDs = set(muni_blocks['GEOID'])
+
+        # Trim each year to the municipality's blocks as soon as it lands
+        frames = []
+        for future in as_completed(futures):
+            segment, job_type, year = futures[future]
+            try:
+                df = future.result().rename(columns=LODES_labels)
+            except Exception as e:
+                print(f"Failed to fetch {kind.upper()} {segment}/{job_type} for {state} in {year}: {e}")
+                continue
+
+            df['GEOID'] = df['GEOID'].str.zfill(15)
+            df = df[df['GEOID'].isin(muni_GEOIDs)]
+            df.insert(1, 'year', year)
+            df.insert(2, 'segment', segment)
+            df.insert(3, 'job_type', job_type)
+            frames.append(df)
+            print(f"Fetched {kind.upper()} {segment}/{job_type} for {state}, year {year}.")
+
+    if not frames:
+        print(f"No {kind.upper()} data was successfully fetched for {state}.")
+        return None
+
+    # One long panel: a row per block, year, segment and job type
+    panel = pd.concat(frames, ignore_index=True).sort_values(['GEOID', 'segment', 'job_type', 'year'], ignore_index=True)
+    count_cols = [col for col in panel.columns if col not in ['GEOID', 'year', 'segment', 'job_type', 'Date']]
+    panel = apply_schema(panel, dtype_backend, keys=['year'], categories=['segment', 'job_type'], dates=['Date'])
+    muni_blocks['GEOID'] = muni_blocks['GEOID'].astype(panel['GEOID'].dtype)
+
+    if shape == 'long':
+        # blocks with no jobs in a year have no row for that year
+        series = muni_blocks.merge(panel, on='GEOID', how='inner')
+    else:
+        # One column per measure and year, e.g. Total_2019; segment and job
+        # type are added to the name only when more than one was requested
+        keys = [key for key in ['segment', 'job_type'] if panel[key].nunique() > 1] + ['year']
+        wide = panel.drop(columns=['Date'], errors='ignore').pivot(index='GEOID', columns=keys, values=count_cols)
+        wide.columns = ['_'.join(str(part) for part in col) for col in wide.columns]
+        # pivoting falls back to object; every year shares the one measure dtype
+        wide = wide.astype(measure_dtype(dtype_backend))
+        series = muni_blocks.merge(wide.reset_index(), on='GEOID', how='left')
+
+    # add municipality column
+    series.insert(1, 'municipality', muni.upper())
+
+    # export to geopackage
+    if export:
+        last_year = max(year for _, _, year, _ in files)
+        series.to_file(f"{kind.upper()}_{muni}_{start_year}-{last_year}.gpkg", driver='GPKG')
 
-    return muni_blocks
\ No newline at end of file
+    return series
@@ -0,0 +1,115 @@
+from collections import defaultdict
+
+from .jt_lazy import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# Supported dtype backends, named after pandas' own `dtype_backend` options
+DTYPE_BACKENDS = ['numpy_nullable', 'pyarrow']
+
+# Measures (counts, estimates) always get one signed width so differences and
+# sums can't wrap and every county's frame lines up column for column. Int64 is
+# used only when a value won't fit in Int32 (e.g. large ACS aggregate dollars).
+MEASURE_INTS = ['int32', 'int64']
+# Small non-negative keys such as year
+KEY_INT = 'uint16'
+
+# numpy integer names -> pandas masked (nullable) integer names
+NULLABLE_INTS = {'int32': 'Int32', 'int64': 'Int64', 'uint16': 'UInt16'}
+
+# Repetitive label columns returned by the census API
+CENSUS_CATEGORIES = ['NAME', 'GeographicAreaName', 'state', 'county', 'tract']
+
+
+def check_backend(dtype_backend):
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Invalid dtype_backend '{dtype_backend}'. Choose either 'numpy_nullable' or 'pyarrow'.")
+
+    if dtype_backend == 'pyarrow':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("dtype_backend='pyarrow' requires pyarrow; install the arrow extra (pip install 'census[arrow]').")
+
+
+def int_dtype(name, dtype_backend='numpy_nullable'):
+    if dtype_backend == 'pyarrow':
+        return f"{name}[pyarrow]"
+    return NULLABLE_INTS[name]
+
+
+def measure_dtype(dtype_backend='numpy_nullable', lo=0, hi=0):
+    for name in MEASURE_INTS:
+        info = np.iinfo(name)
+        if info.min <= lo and hi <= info.max:
+            break
+    return int_dtype(name, dtype_backend)
+
+
+def to_measure(series, dtype_backend='numpy_nullable'):
+    values = pd.to_numeric(series, errors='coerce')
+    valid = values.dropna()
+
+    # Whole-number (or empty) columns become a nullable signed integer. Nullable
+    # types survive left merges against block shapes without falling back to float64.
+    # Integer columns (e.g. Arrow-typed groupby sums) skip the check, and floats go
+    # through float64 because Arrow arrays don't implement %.
+    if pd.api.types.is_integer_dtype(values.dtype) or (valid.astype('float64') % 1 == 0).all():
+        lo, hi = (valid.min(), valid.max()) if not valid.empty else (0, 0)
+        dtype = measure_dtype(dtype_backend, lo, hi)
+        if dtype_backend == 'pyarrow':
+            # go through the masked type so NaN becomes a proper null
+            return values.astype(measure_dtype('numpy_nullable', lo, hi)).astype(dtype)
+        return values.astype(dtype)
+
+    # Fractional values (medians, ratios) keep full float precision
+    if dtype_backend == 'pyarrow':
+        return values.astype('double[pyarrow]')
+    return values.astype('float64')
+
+
+def lodes_dtypes(dtype_backend='numpy_nullable'):
+    # read_csv dtypes for LODES OD/WAC/RAC files: geocodes and dates stay strings,
+    # every job count is parsed straight into the measure type
+    string = 'string[pyarrow]' if dtype_backend == 'pyarrow' else str
+    return defaultdict(lambda: measure_dtype(dtype_backend), w_geocode=string, h_geocode=string, createdate=string)
+
+
+def to_date(series, dtype_backend='numpy_nullable'):
+    # LODES stores dates as YYYYMMDD integers
+    dates = pd.to_datetime(series.astype(str), format='%Y%m%d', errors='coerce')
+    if dtype_backend == 'pyarrow':
+        return dates.astype('date32[pyarrow]')
+    return dates
+
+
+def apply_schema(df, dtype_backend='numpy_nullable', counts=(), keys=(), categories=(), dates=(), strings=()):
+    check_backend(dtype_backend)
+    # shallow copy: only the converted columns get new data
+    df = df.copy(deep=False)
+
+    # Columns not present in this particular pull are skipped
+    for col in counts:
+        if col in df.columns:
+            df[col] = to_measure(df[col], dtype_backend)
+
+    for col in keys:
+        if col in df.columns:
+            df[col] = df[col].astype(int_dtype(KEY_INT, dtype_backend))
+
+    for col in categories:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    for col in dates:
+        if col in df.columns:
+            df[col] = to_date(df[col], dtype_backend)
+
+    for col in strings:
+        if col in df.columns:
+            df[col] = df[col].astype('string[pyarrow]' if dtype_backend == 'pyarrow' else str)
+
+    return df
+
@@ -0,0 +1,27 @@
+import json
+
+from census import jt_cache
+
+
+def census_response(rows):
+    header = ['NAME', 'B01001_001E', 'state', 'county', 'tract', 'block group']
+    data = [header] + [[f'Block Group 1; Census Tract {i}', str(i), '25', '025', f'{i:06d}', '1'] for i in range(rows)]
+    # round trip so every cell is its own string, as with a parsed response
+    return json.loads(json.dumps(data))
+
+
+def test_nbytes_sizes_parsed_responses():
+    small, large = census_response(10), census_response(1000)
+    assert 1_000 < jt_cache.nbytes(small) < 10_000
+    assert 100_000 < jt_cache.nbytes(large) < 1_000_000
+
+
+def test_response_store_evicts_by_bytes():
+    data = census_response(1000)
+    store = jt_cache.new_store(32, 3 * jt_cache.nbytes(data))
+
+    for key in range(5):
+        jt_cache.coalesce(store, key, lambda: data)
+
+    assert list(store['items']) == [2, 3, 4]
+    assert store['bytes'] <= store['maxbytes']
@@ -0,0 +1,59 @@
+import geopandas as gpd
+import yaml
+from shapely.geometry import Point
+
+from census import jt_cli
+
+
+def write_jobfile(path, jobs):
+    jobfile = path / 'jobs.yaml'
+    jobfile.write_text(yaml.safe_dump({'jobs': jobs}))
+    return str(jobfile)
+
+
+def fake_fetch(calls):
+    def fetch(**params):
+        calls.append(params)
+        return gpd.GeoDataFrame({'jobs': [5, 3]}, geometry=[Point(0, 0), Point(1, 1)], crs='EPSG:4326')
+    return fetch
+
+
+def test_duplicate_jobs_compute_once_and_write_every_output(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setitem(jt_cli.JOB_TYPES, 'wac', fake_fetch(calls))
+    job = {'type': 'wac', 'muni': 'Boston', 'state': 'MA', 'year': 2021}
+    jobfile = write_jobfile(tmp_path, [dict(job, name='a', output='a.gpkg'), dict(job, name='b', output='b.gpkg')])
+
+    out = tmp_path / 'out'
+    assert jt_cli.main([jobfile, '-o', str(out)]) == 0
+    assert len(calls) == 1
+    assert calls[0]['export'] is False
+    assert (out / 'a.gpkg').exists()
+    assert (out / 'b.gpkg').exists()
+
+
+def test_duplicate_job_write_failure_is_reported(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setitem(jt_cli.JOB_TYPES, 'wac', fake_fetch(calls))
+    job = {'type': 'wac', 'muni': 'Boston', 'state': 'MA', 'year': 2021}
+    # the second job's output directory doesn't exist, so only its write fails
+    jobfile = write_jobfile(tmp_path, [dict(job, name='a', output='a.gpkg'), dict(job, name='b', output='missing/b.gpkg')])
+
+    out = tmp_path / 'out'
+    results = jt_cli.run_jobs(jt_cli.load_jobs(jobfile)[1], workers=2, output_dir=str(out))
+    assert results['a'][0] == 'ok'
+    assert results['b'][0] == 'failed'
+    assert jt_cli.main([jobfile, '-o', str(out)]) == 1
+
+
+def test_failed_fetch_fails_every_duplicate(tmp_path, monkeypatch):
+    def fetch(**params):
+        raise Exception("boom")
+
+    monkeypatch.setitem(jt_cli.JOB_TYPES, 'wac', fetch)
+    job = {'type': 'wac', 'muni': 'Boston', 'state': 'MA', 'year': 2021}
+    jobs = [dict(job, name='a', output='a.gpkg'), dict(job, name='b', output='b.gpkg')]
+
+    results = jt_cli.run_jobs(jobs, output_dir=str(tmp_path))
+    assert results['a'] == ('failed', None, None, 'boom')
+    assert results['b'] == ('failed', None, None, 'boom')